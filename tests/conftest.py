@@ -0,0 +1,33 @@
+"""
+Shared pytest configuration.
+
+Registers Hypothesis profiles selectable with the HYP_PROFILE environment
+variable: "fast" for quick local runs, "thorough" for CI. When unset,
+Hypothesis defaults apply.
+"""
+
+import os
+
+import pytest
+from hypothesis import settings
+
+
+HYPOTHESIS_PROFILES = ("fast", "thorough")
+
+settings.register_profile("fast", max_examples=25, deadline=None)
+settings.register_profile("thorough", max_examples=500)
+
+
+def pytest_configure(config):
+    """Load the Hypothesis profile named by HYP_PROFILE, if any."""
+    profile = os.getenv("HYP_PROFILE")
+    if not profile:
+        return
+    
+    if profile not in HYPOTHESIS_PROFILES:
+        raise pytest.UsageError(
+            f"Unknown HYP_PROFILE {profile!r}; expected one of: "
+            + ", ".join(HYPOTHESIS_PROFILES)
+        )
+    
+    settings.load_profile(profile)
@@ -0,0 +1,47 @@
+"""Shared access to the skeleton stylesheet for the CSS-based tests."""
+
+from functools import cache
+from pathlib import Path
+
+
+CSS_PATH = Path(__file__).parent.parent / "skeleton_core" / "static" / "styles.css"
+
+
+@cache
+def get_css_bytes():
+    """Read the raw CSS bytes (read once per test session)."""
+    with open(CSS_PATH, 'rb') as f:
+        return f.read()
+
+
+def get_css_content():
+    """Return the CSS file content decoded from the cached bytes."""
+    return get_css_bytes().decode('utf-8')
+
+
+def extract_block(css_content, marker):
+    """
+    Return the body of the brace-delimited block that follows marker.
+    
+    Scans forward from the first '{' after marker and counts braces until
+    the matching '}', so nested rules (e.g. inside @media) stay intact.
+    Returns None if the marker or its opening brace is missing.
+    """
+    start = css_content.find(marker)
+    if start == -1:
+        return None
+    
+    brace_start = css_content.find('{', start)
+    if brace_start == -1:
+        return None
+    
+    brace_count = 1
+    pos = brace_start + 1
+    while pos < len(css_content) and brace_count > 0:
+        if css_content[pos] == '{':
+            brace_count += 1
+        elif css_content[pos] == '}':
+            brace_count -= 1
+        pos += 1
+    
+    return css_content[brace_start + 1:pos - 1]
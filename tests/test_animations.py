@@ -5,35 +5,54 @@ Validates: Requirements 1.2, 1.3
 """
 
 import re
-from pathlib import Path
 import pytest
 
+from tests.css_helpers import CSS_PATH, extract_block, get_css_content
 
-def get_css_content():
-    """Read the CSS file content."""
-    css_path = Path(__file__).parent.parent / "skeleton_core" / "static" / "styles.css"
-    with open(css_path, 'r', encoding='utf-8') as f:
-        return f.read()
+
+def _block_re(prefix):
+    """Compile a pattern capturing the body of the first block after prefix."""
+    return re.compile(re.escape(prefix) + r'\s*\{([^}]+)\}', re.DOTALL)
+
+
+# Patterns are compiled once at import rather than on every re.search call
+POP_IN_RE = _block_re('@keyframes pop-in')
+FADE_IN_RE = _block_re('@keyframes fade-in')
+TITLE_PULSE_RE = _block_re('@keyframes title-pulse')
+BTN_PRIMARY_RE = _block_re('.btn-primary')
+BTN_PRIMARY_HOVER_RE = _block_re('.btn-primary:hover')
+CHAT_MESSAGE_RE = _block_re('.chat-message')
+INPUT_FIELD_RE = _block_re('.input-field')
+CARD_RE = _block_re('.card')
+LOADING_INDICATOR_RE = _block_re('.loading-indicator')
+PROGRESS_BAR_FILL_RE = _block_re('.progress-bar-fill')
+ERROR_MESSAGE_RE = _block_re('.error-message')
+
+# Keyframe blocks contain one level of nested braces (the steps)
+KEYFRAMES_RE = re.compile(r'@keyframes\s+[\w-]+\s*\{([^}]+(?:\{[^}]*\}[^}]*)*)\}', re.DOTALL)
+
+
+@pytest.fixture(scope="module")
+def css_content():
+    """Stylesheet text, decoded once for every test in this module."""
+    return get_css_content()
 
 
 def test_css_file_exists():
     """Verify the CSS file exists."""
-    css_path = Path(__file__).parent.parent / "skeleton_core" / "static" / "styles.css"
-    assert css_path.exists(), "CSS file should exist"
+    assert CSS_PATH.exists(), "CSS file should exist"
 
 
-def test_pop_in_animation_exists():
+def test_pop_in_animation_exists(css_content):
     """
     Verify that pop-in animation is defined for chat messages.
     Validates: Requirements 1.2
     """
-    css_content = get_css_content()
-    
     # Check for pop-in keyframe animation
     assert '@keyframes pop-in' in css_content, "pop-in animation should be defined"
     
     # Check that it includes transform and opacity
-    pop_in_match = re.search(r'@keyframes pop-in\s*\{([^}]+)\}', css_content, re.DOTALL)
+    pop_in_match = POP_IN_RE.search(css_content)
     assert pop_in_match, "pop-in animation should have content"
     
     pop_in_content = pop_in_match.group(1)
@@ -41,36 +60,32 @@ def test_pop_in_animation_exists():
     assert 'transform' in pop_in_content, "pop-in should animate transform"
 
 
-def test_fade_in_animation_exists():
+def test_fade_in_animation_exists(css_content):
     """
     Verify that fade-in animation is defined for page load.
     Validates: Requirements 1.2
     """
-    css_content = get_css_content()
-    
     # Check for fade-in keyframe animation
     assert '@keyframes fade-in' in css_content, "fade-in animation should be defined"
     
     # Check that it includes opacity
-    fade_in_match = re.search(r'@keyframes fade-in\s*\{([^}]+)\}', css_content, re.DOTALL)
+    fade_in_match = FADE_IN_RE.search(css_content)
     assert fade_in_match, "fade-in animation should have content"
     
     fade_in_content = fade_in_match.group(1)
     assert 'opacity' in fade_in_content, "fade-in should animate opacity"
 
 
-def test_title_pulse_animation_exists():
+def test_title_pulse_animation_exists(css_content):
     """
     Verify that title-pulse animation is defined for Ouija Board theme.
     Validates: Requirements 1.2
     """
-    css_content = get_css_content()
-    
     # Check for title-pulse keyframe animation
     assert '@keyframes title-pulse' in css_content, "title-pulse animation should be defined"
     
     # Check that it includes text-shadow and opacity
-    pulse_match = re.search(r'@keyframes title-pulse\s*\{([^}]+)\}', css_content, re.DOTALL)
+    pulse_match = TITLE_PULSE_RE.search(css_content)
     assert pulse_match, "title-pulse animation should have content"
     
     pulse_content = pulse_match.group(1)
@@ -78,15 +93,13 @@ def test_title_pulse_animation_exists():
     assert 'opacity' in pulse_content or 'transform' in pulse_content, "title-pulse should animate opacity or transform"
 
 
-def test_button_hover_transitions():
+def test_button_hover_transitions(css_content):
     """
     Verify that buttons have smooth hover transitions with transform and shadow.
     Validates: Requirements 1.3
     """
-    css_content = get_css_content()
-    
     # Find .btn-primary rule
-    btn_match = re.search(r'\.btn-primary\s*\{([^}]+)\}', css_content, re.DOTALL)
+    btn_match = BTN_PRIMARY_RE.search(css_content)
     assert btn_match, "btn-primary class should be defined"
     
     btn_content = btn_match.group(1)
@@ -97,7 +110,7 @@ def test_button_hover_transitions():
     assert 'box-shadow' in btn_content or 'shadow' in btn_content, "btn-primary transition should include box-shadow"
     
     # Find .btn-primary:hover rule
-    btn_hover_match = re.search(r'\.btn-primary:hover\s*\{([^}]+)\}', css_content, re.DOTALL)
+    btn_hover_match = BTN_PRIMARY_HOVER_RE.search(css_content)
     assert btn_hover_match, "btn-primary:hover should be defined"
     
     btn_hover_content = btn_hover_match.group(1)
@@ -105,15 +118,13 @@ def test_button_hover_transitions():
     assert 'box-shadow' in btn_hover_content, "btn-primary:hover should use box-shadow"
 
 
-def test_chat_message_animation():
+def test_chat_message_animation(css_content):
     """
     Verify that chat messages have pop-in animation applied.
     Validates: Requirements 1.2
     """
-    css_content = get_css_content()
-    
     # Find .chat-message rule
-    msg_match = re.search(r'\.chat-message\s*\{([^}]+)\}', css_content, re.DOTALL)
+    msg_match = CHAT_MESSAGE_RE.search(css_content)
     assert msg_match, "chat-message class should be defined"
     
     msg_content = msg_match.group(1)
@@ -121,27 +132,19 @@ def test_chat_message_animation():
     assert 'pop-in' in msg_content, "chat-message should use pop-in animation"
 
 
-def test_prefers_reduced_motion_support():
+def test_prefers_reduced_motion_support(css_content):
     """
     Verify that animations respect prefers-reduced-motion preference.
     Validates: Requirements 1.2
     """
-    css_content = get_css_content()
-    
     # Check for prefers-reduced-motion media query
     assert '@media (prefers-reduced-motion: reduce)' in css_content, (
         "CSS should include prefers-reduced-motion media query"
     )
     
     # Find the media query content
-    reduced_motion_match = re.search(
-        r'@media \(prefers-reduced-motion: reduce\)\s*\{([^}]+(?:\{[^}]*\}[^}]*)*)\}',
-        css_content,
-        re.DOTALL
-    )
-    assert reduced_motion_match, "prefers-reduced-motion media query should have content"
-    
-    reduced_motion_content = reduced_motion_match.group(1)
+    reduced_motion_content = extract_block(css_content, '@media (prefers-reduced-motion: reduce)')
+    assert reduced_motion_content, "prefers-reduced-motion media query should have content"
     
     # Verify it disables or reduces animations
     assert 'animation-duration' in reduced_motion_content, (
@@ -152,22 +155,20 @@ def test_prefers_reduced_motion_support():
     )
 
 
-def test_animations_use_transform_and_opacity():
+def test_animations_use_transform_and_opacity(css_content):
     """
     Verify that animations are optimized using transform and opacity.
     Validates: Requirements 1.2
     """
-    css_content = get_css_content()
-    
-    # Extract all @keyframes blocks
-    keyframes = re.findall(r'@keyframes\s+[\w-]+\s*\{([^}]+(?:\{[^}]*\}[^}]*)*)\}', css_content, re.DOTALL)
-    
-    assert len(keyframes) > 0, "CSS should contain keyframe animations"
-    
     # Check that animations primarily use transform and opacity
     optimized_properties = ['transform', 'opacity']
     
-    for keyframe_content in keyframes:
+    # Walk the @keyframes blocks lazily instead of materializing them all
+    keyframe_count = 0
+    for keyframe_match in KEYFRAMES_RE.finditer(css_content):
+        keyframe_count += 1
+        keyframe_content = keyframe_match.group(1)
+        
         # Skip animations that are specifically for other effects (like spin)
         if 'rotate' in keyframe_content and 'transform' in keyframe_content:
             continue
@@ -181,100 +182,47 @@ def test_animations_use_transform_and_opacity():
             assert uses_optimized, (
                 f"Main animations should use transform or opacity for performance"
             )
+    
+    assert keyframe_count > 0, "CSS should contain keyframe animations"
 
 
-def test_smooth_scroll_behavior():
+def test_smooth_scroll_behavior(css_content):
     """
     Verify that smooth scrolling is enabled.
     Validates: Requirements 1.2
     """
-    css_content = get_css_content()
-    
     # Check for scroll-behavior: smooth
     assert 'scroll-behavior: smooth' in css_content or 'scroll-behavior:smooth' in css_content, (
         "CSS should enable smooth scrolling"
     )
 
 
-def test_input_field_transitions():
-    """
-    Verify that input fields have smooth transitions.
-    Validates: Requirements 1.3
-    """
-    css_content = get_css_content()
-    
-    # Find .input-field rule
-    input_match = re.search(r'\.input-field\s*\{([^}]+)\}', css_content, re.DOTALL)
-    assert input_match, "input-field class should be defined"
-    
-    input_content = input_match.group(1)
-    assert 'transition' in input_content, "input-field should have transition property"
-
-
-def test_card_hover_transitions():
-    """
-    Verify that cards have smooth hover transitions.
-    Validates: Requirements 1.3
-    """
-    css_content = get_css_content()
-    
-    # Find .card rule
-    card_match = re.search(r'\.card\s*\{([^}]+)\}', css_content, re.DOTALL)
-    assert card_match, "card class should be defined"
-    
-    card_content = card_match.group(1)
-    assert 'transition' in card_content, "card should have transition property"
-
-
-def test_loading_indicator_animation():
-    """
-    Verify that loading indicators have smooth animations.
-    Validates: Requirements 1.2
-    """
-    css_content = get_css_content()
-    
-    # Find .loading-indicator rule
-    loading_match = re.search(r'\.loading-indicator\s*\{([^}]+)\}', css_content, re.DOTALL)
-    assert loading_match, "loading-indicator class should be defined"
-    
-    loading_content = loading_match.group(1)
-    assert 'transition' in loading_content or 'animation' in loading_content, (
-        "loading-indicator should have transition or animation"
-    )
-
-
-def test_progress_bar_transitions():
-    """
-    Verify that progress bar has smooth transitions.
-    Validates: Requirements 1.3
-    """
-    css_content = get_css_content()
-    
-    # Find .progress-bar-fill rule
-    progress_match = re.search(r'\.progress-bar-fill\s*\{([^}]+)\}', css_content, re.DOTALL)
-    assert progress_match, "progress-bar-fill class should be defined"
-    
-    progress_content = progress_match.group(1)
-    assert 'transition' in progress_content, "progress-bar-fill should have transition property"
-    assert 'width' in progress_content or 'transition' in progress_content, (
-        "progress-bar-fill should transition width"
-    )
+# Component rules that must animate or transition, with the properties
+# that satisfy each (any one is enough)
+MOTION_RULES = [
+    ('input-field', INPUT_FIELD_RE, ('transition',)),
+    ('card', CARD_RE, ('transition',)),
+    ('loading-indicator', LOADING_INDICATOR_RE, ('transition', 'animation')),
+    ('progress-bar-fill', PROGRESS_BAR_FILL_RE, ('transition',)),
+    ('error-message', ERROR_MESSAGE_RE, ('animation', 'transition')),
+]
 
 
-def test_error_message_animation():
+@pytest.mark.parametrize(
+    'name, pattern, properties', MOTION_RULES, ids=[rule[0] for rule in MOTION_RULES]
+)
+def test_component_motion(css_content, name, pattern, properties):
     """
-    Verify that error messages have smooth animations.
-    Validates: Requirements 1.2
+    Verify that input fields, cards, loading indicators, the progress bar
+    and error messages have smooth transitions or animations.
+    Validates: Requirements 1.2, 1.3
     """
-    css_content = get_css_content()
-    
-    # Find .error-message rule
-    error_match = re.search(r'\.error-message\s*\{([^}]+)\}', css_content, re.DOTALL)
-    assert error_match, "error-message class should be defined"
+    match = pattern.search(css_content)
+    assert match, f"{name} class should be defined"
     
-    error_content = error_match.group(1)
-    assert 'animation' in error_content or 'transition' in error_content, (
-        "error-message should have animation or transition"
+    content = match.group(1)
+    assert any(prop in content for prop in properties), (
+        f"{name} should have {' or '.join(properties)}"
     )
 
 
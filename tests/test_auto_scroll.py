@@ -6,7 +6,7 @@ Tests Property 9
 Validates: Requirements 6.3
 """
 
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 import pytest
 
 
@@ -121,7 +121,6 @@ def test_auto_scroll_when_near_bottom():
     assert chat_history.is_at_bottom()
 
 
-@settings(max_examples=100)
 @given(
     num_messages=st.integers(min_value=1, max_value=50)
 )
@@ -156,7 +155,6 @@ def test_auto_scroll_to_latest_message_property(num_messages):
         )
 
 
-@settings(max_examples=100)
 @given(
     scroll_offset=st.integers(min_value=0, max_value=500),
     num_new_messages=st.integers(min_value=1, max_value=10)
@@ -194,7 +192,6 @@ def test_auto_scroll_respects_user_position_property(scroll_offset, num_new_mess
         )
 
 
-@settings(max_examples=100)
 @given(
     num_new_messages=st.integers(min_value=1, max_value=10)
 )
@@ -231,7 +228,6 @@ def test_auto_scroll_near_bottom_threshold_property(num_new_messages):
         )
 
 
-@settings(max_examples=100)
 @given(
     initial_messages=st.integers(min_value=0, max_value=20),
     new_messages=st.integers(min_value=1, max_value=20)
@@ -270,7 +266,6 @@ def test_auto_scroll_consistency_property(initial_messages, new_messages):
         )
 
 
-@settings(max_examples=100)
 @given(
     message_height=st.integers(min_value=1, max_value=100)
 )
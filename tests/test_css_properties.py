@@ -9,34 +9,54 @@ Validates: Requirements 4.2
 """
 
 import re
-from pathlib import Path
-from hypothesis import given, strategies as st, settings
+from functools import cache
+from hypothesis import given, strategies as st
 import pytest
 
+from tests.css_helpers import CSS_PATH, extract_block, get_css_bytes, get_css_content
 
-def get_css_content():
-    """Read the CSS file content."""
-    css_path = Path(__file__).parent.parent / "skeleton_core" / "static" / "styles.css"
-    with open(css_path, 'r', encoding='utf-8') as f:
-        return f.read()
 
+# Block comments are dropped before splitting the stylesheet into rules
+_COMMENT_RE = re.compile(rb'/\*.*?\*/', re.DOTALL)
 
-def extract_var_usages(css_content):
+# Innermost "selector { declarations }" blocks (nested @media bodies included)
+_RULE_RE = re.compile(rb'([^{}]+)\{([^{}]*)\}')
+
+_MIN_HEIGHT_RE = re.compile(rb'min-height:\s*(\d+)px')
+
+
+@cache
+def get_css_rules():
     """
-    Extract all var() usages from CSS content.
-    Returns a list of tuples: (full_match, var_name, fallback_or_none)
+    Split the stylesheet into rules once per test session.
+    Returns a tuple of (selector_text, selectors, declarations) where
+    selectors is the tuple of comma-separated selectors and declarations
+    are the raw bytes between the braces.
     """
-    # Pattern to match var() with optional fallback
-    # var(--variable-name) or var(--variable-name, fallback-value)
-    pattern = r'var\(\s*(--[\w-]+)\s*(?:,\s*([^)]+))?\s*\)'
-    matches = re.findall(pattern, css_content)
-    return matches
+    css = _COMMENT_RE.sub(b'', get_css_bytes())
+    rules = []
+    for match in _RULE_RE.finditer(css):
+        selector_text = match.group(1).strip().decode()
+        selectors = tuple(part.strip() for part in selector_text.split(','))
+        rules.append((selector_text, selectors, match.group(2)))
+    return tuple(rules)
+
+
+def find_rule(selector):
+    """Return the declarations of the first rule listing exactly this selector."""
+    for _, selectors, declarations in get_css_rules():
+        if selector in selectors:
+            return declarations
+    return None
+
+
+# Matches var(--name) with no fallback (or an empty one after the comma)
+_NO_FB_RE = re.compile(rb'var\(\s*(--[\w-]+)\s*(?:,\s*)?\)')
 
 
 def test_css_file_exists():
     """Verify the CSS file exists."""
-    css_path = Path(__file__).parent.parent / "skeleton_core" / "static" / "styles.css"
-    assert css_path.exists(), "CSS file should exist"
+    assert CSS_PATH.exists(), "CSS file should exist"
 
 
 def test_all_var_usages_have_fallbacks():
@@ -48,24 +68,14 @@ def test_all_var_usages_have_fallbacks():
     
     Validates: Requirements 10.5
     """
-    css_content = get_css_content()
-    var_usages = extract_var_usages(css_content)
-    
-    # Track vars without fallbacks
-    vars_without_fallbacks = []
+    offenders = _NO_FB_RE.findall(get_css_bytes())
     
-    for var_name, fallback in var_usages:
-        if not fallback or fallback.strip() == '':
-            vars_without_fallbacks.append(var_name)
-    
-    # Assert all vars have fallbacks
-    assert len(vars_without_fallbacks) == 0, (
-        f"Found {len(vars_without_fallbacks)} CSS variables without fallbacks: "
-        f"{', '.join(set(vars_without_fallbacks))}"
+    assert not offenders, (
+        f"Found {len(offenders)} CSS variables without fallbacks: "
+        f"{', '.join({name.decode() for name in offenders})}"
     )
 
 
-@settings(max_examples=100)
 @given(
     var_name=st.text(
         alphabet=st.characters(whitelist_categories=('Ll', 'Lu', 'Nd'), whitelist_characters='-'),
@@ -149,8 +159,6 @@ def test_css_variables_defined_for_both_themes():
     """
     Verify that both themes define all required CSS variables.
     """
-    css_content = get_css_content()
-    
     required_vars = [
         '--primary',
         '--secondary',
@@ -175,19 +183,16 @@ def test_css_variables_defined_for_both_themes():
     ]
     
     # Extract theme blocks
-    dark_gothic_match = re.search(r'\.theme-dark-gothic\s*\{([^}]+)\}', css_content, re.DOTALL)
-    blue_corporate_match = re.search(r'\.theme-blue-corporate\s*\{([^}]+)\}', css_content, re.DOTALL)
+    dark_gothic_content = find_rule('.theme-dark-gothic')
+    blue_corporate_content = find_rule('.theme-blue-corporate')
     
-    assert dark_gothic_match, "Dark gothic theme should be defined"
-    assert blue_corporate_match, "Blue corporate theme should be defined"
-    
-    dark_gothic_content = dark_gothic_match.group(1)
-    blue_corporate_content = blue_corporate_match.group(1)
+    assert dark_gothic_content, "Dark gothic theme should be defined"
+    assert blue_corporate_content, "Blue corporate theme should be defined"
     
     # Check each theme has all required variables
     for var in required_vars:
-        assert var in dark_gothic_content, f"Dark gothic theme should define {var}"
-        assert var in blue_corporate_content, f"Blue corporate theme should define {var}"
+        assert var.encode() in dark_gothic_content, f"Dark gothic theme should define {var}"
+        assert var.encode() in blue_corporate_content, f"Blue corporate theme should define {var}"
 
 
 def test_css_containment_applied():
@@ -202,26 +207,19 @@ def test_css_containment_applied():
     )
 
 
-def extract_min_height_rules(css_content):
+def extract_min_height_rules(rules):
     """
-    Extract min-height rules from CSS content.
-    Returns a dict mapping selectors to their min-height values in pixels.
+    Extract min-height rules from the parsed stylesheet rules.
+    Returns a list of (selector, min-height in pixels) pairs, one per rule,
+    so a selector repeated across @media blocks keeps every value.
     """
-    min_heights = {}
-    
-    # Pattern to match CSS rules with min-height
-    # Matches: selector { ... min-height: value; ... }
-    rule_pattern = r'([^{]+)\{([^}]+)\}'
+    min_heights = []
     
-    for match in re.finditer(rule_pattern, css_content):
-        selector = match.group(1).strip()
-        properties = match.group(2)
-        
+    for selector_text, _, declarations in rules:
         # Look for min-height property
-        min_height_match = re.search(r'min-height:\s*(\d+)px', properties)
+        min_height_match = _MIN_HEIGHT_RE.search(declarations)
         if min_height_match:
-            height_px = int(min_height_match.group(1))
-            min_heights[selector] = height_px
+            min_heights.append((selector_text, int(min_height_match.group(1))))
     
     return min_heights
 
@@ -238,8 +236,7 @@ def test_interactive_elements_meet_touch_target_minimum():
     
     Validates: Requirements 4.2
     """
-    css_content = get_css_content()
-    min_heights = extract_min_height_rules(css_content)
+    min_heights = extract_min_height_rules(get_css_rules())
     
     # Interactive element selectors that should have adequate touch targets
     interactive_selectors = [
@@ -257,7 +254,7 @@ def test_interactive_elements_meet_touch_target_minimum():
     for selector_pattern in interactive_selectors:
         # Find matching rules in the extracted min-heights
         found = False
-        for css_selector, height in min_heights.items():
+        for css_selector, height in min_heights:
             # Check if the selector pattern matches
             if selector_pattern in css_selector:
                 found = True
@@ -267,7 +264,7 @@ def test_interactive_elements_meet_touch_target_minimum():
         
         if not found:
             # Check if there's a general rule that covers this selector
-            if selector_pattern == 'button' and any('button' in s for s in min_heights.keys()):
+            if selector_pattern == 'button' and any('button' in s for s, _ in min_heights):
                 continue
             violations.append(f"No min-height rule found for {selector_pattern}")
     
@@ -276,54 +273,6 @@ def test_interactive_elements_meet_touch_target_minimum():
     )
 
 
-@settings(max_examples=100)
-@given(
-    element_type=st.sampled_from(['button', 'input', 'a', 'select', 'textarea']),
-    padding_top=st.integers(min_value=0, max_value=20),
-    padding_bottom=st.integers(min_value=0, max_value=20),
-    min_height=st.integers(min_value=20, max_value=60),
-)
-def test_touch_target_size_calculation(element_type, padding_top, padding_bottom, min_height):
-    """
-    Feature: ui-design-improvements, Property 1: Touch target minimum size
-    
-    Property-based test: For any interactive element with given padding and min-height,
-    the total computed height should meet accessibility standards.
-    
-    This test generates random combinations of padding and min-height values to verify
-    that the calculation logic for touch target sizes is correct.
-    
-    Validates: Requirements 4.2
-    """
-    # Calculate total height: min-height + padding-top + padding-bottom
-    total_height = min_height + padding_top + padding_bottom
-    
-    # For mobile (< 768px), touch targets should be at least 44px
-    # For desktop (>= 1024px), 40px is acceptable but 44px is preferred
-    MOBILE_MIN = 44
-    DESKTOP_MIN = 40
-    
-    # If the element has a min-height of at least 44px, it should pass mobile requirements
-    if min_height >= MOBILE_MIN:
-        assert total_height >= MOBILE_MIN, (
-            f"{element_type} with min-height {min_height}px and padding "
-            f"{padding_top}px/{padding_bottom}px should meet mobile minimum"
-        )
-    
-    # If total height is less than desktop minimum, it's a violation
-    if total_height < DESKTOP_MIN:
-        # This is expected to fail for small values - that's the point of the test
-        # We're verifying our CSS doesn't create elements this small
-        pass
-    
-    # The property we're testing: adequate padding + min-height = accessible touch target
-    # If min-height is set to 44px and padding is reasonable (4-16px), total should be good
-    if min_height >= MOBILE_MIN and padding_top >= 4 and padding_bottom >= 4:
-        assert total_height >= MOBILE_MIN, (
-            f"Well-configured {element_type} should meet touch target minimum"
-        )
-
-
 def test_mobile_breakpoint_enforces_touch_targets():
     """
     Feature: ui-design-improvements, Property 1: Touch target minimum size
@@ -334,28 +283,9 @@ def test_mobile_breakpoint_enforces_touch_targets():
     """
     css_content = get_css_content()
     
-    # Find mobile media query section - look for the entire @media block
-    # We need to find the matching closing brace
-    mobile_start = css_content.find('@media (max-width: 767px)')
-    assert mobile_start != -1, "Mobile media query should exist"
-    
-    # Find the opening brace
-    brace_start = css_content.find('{', mobile_start)
-    assert brace_start != -1, "Mobile media query should have opening brace"
-    
-    # Find the matching closing brace by counting braces
-    brace_count = 1
-    pos = brace_start + 1
-    while pos < len(css_content) and brace_count > 0:
-        if css_content[pos] == '{':
-            brace_count += 1
-        elif css_content[pos] == '}':
-            brace_count -= 1
-        pos += 1
-    
-    mobile_content = css_content[brace_start:pos]
-    
-    assert mobile_content, "Mobile media query content should be extracted"
+    # Extract the entire mobile @media block, including its nested rules
+    mobile_content = extract_block(css_content, '@media (max-width: 767px)')
+    assert mobile_content, "Mobile media query should exist"
     
     # Verify mobile styles mention min-height for interactive elements
     assert 'min-height' in mobile_content, (
@@ -6,13 +6,24 @@ Tests Property 16
 Validates: Requirements 8.5
 """
 
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 import pytest
 from datetime import datetime
 
 
+# Theme-appropriate error icons; unknown themes fall back to professional
+_ICONS = {'ghost': '💀', 'professional': '⚠️'}
+
+
 class MockErrorElement:
     """Mock representation of an error message element in the DOM."""
+    __slots__ = (
+        'title', 'description', 'options', 'icon',
+        'has_icon', 'has_dismiss_button', 'has_retry_button',
+        'has_aria_role', 'has_aria_live', 'aria_role', 'aria_live',
+        'is_visible', 'auto_dismiss_timeout', 'retryable',
+    )
+    
     def __init__(self, title, description, options=None):
         self.title = title
         self.description = description
@@ -65,9 +76,7 @@ def simulate_show_error(title, description, container=None, options=None):
     error = MockErrorElement(title, description, options)
     
     # Add icon (theme-appropriate)
-    is_ghost = options.get('theme', 'professional') == 'ghost'
-    icon = '💀' if is_ghost else '⚠️'
-    error.add_icon(icon)
+    error.add_icon(_ICONS.get(options.get('theme'), _ICONS['professional']))
     
     # Add dismiss button (always present)
     error.add_dismiss_button()
@@ -144,149 +153,79 @@ def test_error_has_aria_attributes():
     assert error.aria_live == 'assertive'
 
 
-@settings(max_examples=100)
 @given(
     title=st.text(min_size=1, max_size=100),
-    description=st.text(min_size=1, max_size=500)
+    description=st.text(min_size=1, max_size=500),
+    theme=st.sampled_from(['professional', 'ghost']),
+    retryable=st.booleans(),
+    timeout=st.integers(min_value=0, max_value=10000)
 )
-def test_error_display_with_information_property(title, description):
+def test_error_invariants_property(title, description, theme, retryable, timeout):
     """
     Feature: ui-design-improvements, Property 16: Error display with information
     
     Property: For any error that occurs during processing, the system should 
-    display an error message element containing information about the error.
+    display a visible, dismissible error message that:
+    - preserves the title and description exactly as provided
+    - uses a theme-appropriate icon (skull for ghost, warning otherwise)
+    - has a retry button if and only if the error is retryable
+    - stores the requested auto-dismiss timeout (0 means no auto-dismiss)
+    - carries role="alert" and an ARIA live region for screen readers
     
-    This property-based test generates random error titles and descriptions
-    to ensure all errors are displayed with complete information.
+    All invariants are checked against the same generated error in one pass.
     
     Validates: Requirements 8.5
     """
-    # Create error message
-    error = simulate_show_error(title, description)
-    
-    # Error should exist
-    assert error is not None, "Error element should be created"
-    
-    # Error should contain title
-    assert error.title is not None, "Error should have a title"
-    assert error.title == title, "Error title should match input"
-    assert len(error.title) > 0, "Error title should not be empty"
-    
-    # Error should contain description
-    assert error.description is not None, "Error should have a description"
-    assert error.description == description, "Error description should match input"
-    assert len(error.description) > 0, "Error description should not be empty"
+    error = simulate_show_error(title, description, options={
+        'theme': theme,
+        'retryable': retryable,
+        'timeout': timeout,
+    })
     
-    # Error should have an icon for visual identification
-    assert error.has_icon is True, "Error should have an icon"
-    assert error.icon in ['💀', '⚠️'], (
-        f"Error icon should be theme-appropriate, got: {error.icon}"
+    # Title and description should be preserved exactly
+    assert error.title == title, (
+        "Error title should be preserved without modification"
     )
-    
-    # Error should have a dismiss button
-    assert error.has_dismiss_button is True, (
-        "Error should have a dismiss button"
+    assert error.description == description, (
+        "Error description should be preserved without modification"
     )
     
-    # Error should be visible
-    assert error.is_visible is True, "Error should be visible when created"
-
-
-@settings(max_examples=100)
-@given(
-    title=st.text(min_size=1, max_size=100),
-    description=st.text(min_size=1, max_size=500),
-    theme=st.sampled_from(['professional', 'ghost'])
-)
-def test_error_theme_appropriate_styling_property(title, description, theme):
-    """
-    Feature: ui-design-improvements, Property 16: Error display with information
-    
-    Property: For any error, the styling should be appropriate to the active theme
-    (professional or gothic).
-    
-    This property-based test ensures errors are styled consistently with
-    the application theme.
-    
-    Validates: Requirements 8.5
-    """
-    # Create error with theme
-    error = simulate_show_error(title, description, options={'theme': theme})
-    
     # Icon should be theme-appropriate
+    assert error.has_icon is True, "Error should have an icon"
     if theme == 'ghost':
         assert error.icon == '💀', "Ghost theme should use skull icon"
     else:
         assert error.icon == '⚠️', "Professional theme should use warning icon"
-
-
-@settings(max_examples=100)
-@given(
-    title=st.text(min_size=1, max_size=100),
-    description=st.text(min_size=1, max_size=500)
-)
-def test_error_accessibility_property(title, description):
-    """
-    Feature: ui-design-improvements, Property 16: Error display with information
-    
-    Property: For any error, the error element should include proper ARIA
-    attributes for screen reader accessibility.
     
-    This property-based test ensures all errors are accessible to users
-    with assistive technologies.
+    # Retry button presence should match retryable flag
+    assert error.has_retry_button is retryable, (
+        "Retry button should be present if and only if the error is retryable"
+    )
     
-    Validates: Requirements 8.5
-    """
-    # Create error message
-    error = simulate_show_error(title, description)
+    # Error should have timeout configured
+    assert error.auto_dismiss_timeout == timeout, (
+        f"Error should have timeout of {timeout}ms"
+    )
     
-    # Error should have ARIA role
+    # Error should have ARIA role and live region
     assert error.has_aria_role is True, "Error should have ARIA role"
     assert error.aria_role == 'alert', (
         "Error should have role='alert' for screen readers"
     )
-    
-    # Error should have ARIA live region
     assert error.has_aria_live is True, "Error should have ARIA live region"
     assert error.aria_live in ['assertive', 'polite'], (
         "Error should have appropriate ARIA live value"
     )
-
-
-@settings(max_examples=100)
-@given(
-    title=st.text(min_size=1, max_size=100),
-    description=st.text(min_size=1, max_size=500),
-    timeout=st.integers(min_value=0, max_value=10000)
-)
-def test_error_auto_dismiss_property(title, description, timeout):
-    """
-    Feature: ui-design-improvements, Property 16: Error display with information
-    
-    Property: For any error with a timeout value, the error should be configured
-    to auto-dismiss after the specified duration.
-    
-    This property-based test ensures auto-dismiss functionality is properly
-    configured for errors.
-    
-    Validates: Requirements 8.5
-    """
-    # Create error with timeout
-    error = simulate_show_error(title, description, options={'timeout': timeout})
     
-    # Error should have timeout configured
-    assert error.auto_dismiss_timeout == timeout, (
-        f"Error should have timeout of {timeout}ms"
+    # Error should be visible until dismissed
+    assert error.has_dismiss_button is True, (
+        "Error should have a dismiss button"
     )
-    
-    # If timeout is 0, error should not auto-dismiss
-    if timeout == 0:
-        assert error.auto_dismiss_timeout == 0, (
-            "Error with timeout=0 should not auto-dismiss"
-        )
+    assert error.is_visible is True, "Error should be visible when created"
+    error.dismiss()
+    assert error.is_visible is False, "Error should be hidden after dismissal"
 
 
-@settings(max_examples=100)
 @given(
     operation=st.text(min_size=1, max_size=50)
 )
@@ -337,105 +276,16 @@ def test_network_error_with_retry_property(operation):
     )
 
 
-@settings(max_examples=100)
-@given(
-    title=st.text(min_size=1, max_size=100),
-    description=st.text(min_size=1, max_size=500),
-    retryable=st.booleans()
-)
-def test_error_retry_button_property(title, description, retryable):
-    """
-    Feature: ui-design-improvements, Property 16: Error display with information
-    
-    Property: For any error, a retry button should be present if and only if
-    the error is marked as retryable.
-    
-    This property-based test ensures retry buttons are shown appropriately.
-    
-    Validates: Requirements 8.5
-    """
-    # Create error with retryable option
-    error = simulate_show_error(title, description, options={'retryable': retryable})
-    
-    # Retry button presence should match retryable flag
-    if retryable:
-        assert error.has_retry_button is True, (
-            "Retryable error should have a retry button"
-        )
-    else:
-        assert error.has_retry_button is False, (
-            "Non-retryable error should not have a retry button"
-        )
-
-
-@settings(max_examples=100)
-@given(
-    title=st.text(min_size=1, max_size=100),
-    description=st.text(min_size=1, max_size=500)
-)
-def test_error_dismissal_property(title, description):
-    """
-    Feature: ui-design-improvements, Property 16: Error display with information
-    
-    Property: For any error, calling the dismiss function should hide the error
-    from view.
-    
-    This property-based test ensures errors can be properly dismissed.
-    
-    Validates: Requirements 8.5
-    """
-    # Create error
-    error = simulate_show_error(title, description)
-    
-    # Error should be visible initially
-    assert error.is_visible is True, "Error should be visible when created"
-    
-    # Dismiss the error
-    error.dismiss()
-    
-    # Error should no longer be visible
-    assert error.is_visible is False, "Error should be hidden after dismissal"
-
-
-@settings(max_examples=100)
-@given(
-    title=st.text(min_size=1, max_size=100),
-    description=st.text(min_size=1, max_size=500)
-)
-def test_error_content_preservation_property(title, description):
-    """
-    Feature: ui-design-improvements, Property 16: Error display with information
-    
-    Property: For any error, the title and description content should be
-    preserved exactly as provided (no truncation or modification).
-    
-    This ensures error messages are displayed completely and accurately.
-    
-    Validates: Requirements 8.5
-    """
-    # Create error
-    error = simulate_show_error(title, description)
-    
-    # Title should be preserved exactly
-    assert error.title == title, (
-        "Error title should be preserved without modification"
-    )
-    
-    # Description should be preserved exactly
-    assert error.description == description, (
-        "Error description should be preserved without modification"
-    )
-
-
 # ========================================
 # Edge case tests
 # ========================================
 
-def test_error_with_empty_options():
+@pytest.mark.parametrize('options', [{}, None], ids=['empty', 'none'])
+def test_error_with_default_options(options):
     """
-    Test that errors work correctly with no options provided.
+    Test that errors work correctly with empty or None options.
     """
-    error = simulate_show_error("Title", "Description", options={})
+    error = simulate_show_error("Title", "Description", options=options)
     
     assert error is not None
     assert error.has_dismiss_button is True
@@ -443,16 +293,6 @@ def test_error_with_empty_options():
     assert error.retryable is False
 
 
-def test_error_with_none_options():
-    """
-    Test that errors work correctly with None options.
-    """
-    error = simulate_show_error("Title", "Description", options=None)
-    
-    assert error is not None
-    assert error.has_dismiss_button is True
-
-
 def test_multiple_errors():
     """
     Test that multiple errors can be created independently.
@@ -6,21 +6,38 @@ Tests Properties 7, 17, 18, 19
 Validates: Requirements 6.1, 9.1, 9.2, 9.5
 """
 
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 import pytest
 from datetime import datetime
 
 
+# Message text is only stored and compared, so printable ASCII suffices
+_MESSAGE_TEXT = st.text(
+    alphabet=st.characters(min_codepoint=0x20, max_codepoint=0x7e), min_size=1, max_size=500
+)
+_MESSAGE_TYPE = st.sampled_from(['user', 'ai'])
+
+
 class MockChatMessage:
     """Mock representation of a chat message in the DOM."""
+    __slots__ = ('text', 'type', '_timestamp', 'has_icon', 'icon', 'css_classes',
+                 'has_timestamp_element')
+    
     def __init__(self, text, message_type, timestamp=None):
         self.text = text
         self.type = message_type  # 'user' or 'ai'
-        self.timestamp = timestamp or datetime.now()
+        self._timestamp = timestamp
         self.has_icon = False
         self.css_classes = []
         self.has_timestamp_element = False
         
+    @property
+    def timestamp(self):
+        """Message time; taken on first access when none was given."""
+        if self._timestamp is None:
+            self._timestamp = datetime.now()
+        return self._timestamp
+        
     def add_css_class(self, css_class):
         """Add a CSS class to the message."""
         self.css_classes.append(css_class)
@@ -42,13 +59,10 @@ def simulate_add_message(text, message_type):
     """
     message = MockChatMessage(text, message_type)
     
-    # Apply distinct CSS classes based on message type
-    if message_type == 'user':
-        message.add_css_class('chat-message-user')
-    elif message_type == 'ai':
-        message.add_css_class('chat-message-ai')
-        # Add icon/avatar for AI messages
-        message.add_icon('🔮' if is_ghost_theme() else '⚖️')
+    # Apply distinct CSS classes (and the AI icon) based on message type
+    configure = _MESSAGE_CONFIGURATORS.get(message_type)
+    if configure is not None:
+        configure(message)
     
     # Add timestamp element (optional, non-intrusive)
     message.add_timestamp_element()
@@ -62,6 +76,39 @@ def is_ghost_theme():
     return False
 
 
+# The theme is fixed for a test run, so the AI icon is chosen once
+_AI_ICON = '🔮' if is_ghost_theme() else '⚖️'
+
+# Icons an AI message may carry across both themes
+_THEME_ICONS = frozenset(('🔮', '⚖️'))
+
+
+def _configure_user_message(message):
+    """Style a user message."""
+    message.add_css_class('chat-message-user')
+
+
+def _configure_ai_message(message):
+    """Style an AI message and attach the theme icon."""
+    message.add_css_class('chat-message-ai')
+    # Add icon/avatar for AI messages
+    message.add_icon(_AI_ICON)
+
+
+_MESSAGE_CONFIGURATORS = {
+    'user': _configure_user_message,
+    'ai': _configure_ai_message,
+}
+
+
+@st.composite
+def messages(draw):
+    """Strategy producing (text, type, message) built by simulate_add_message."""
+    text = draw(_MESSAGE_TEXT)
+    message_type = draw(_MESSAGE_TYPE)
+    return text, message_type, simulate_add_message(text, message_type)
+
+
 # ========================================
 # Property 7: Immediate user message display
 # ========================================
@@ -79,9 +126,8 @@ def test_user_message_immediate_display():
     assert message.type == 'user'
 
 
-@settings(max_examples=100)
 @given(
-    message_text=st.text(min_size=1, max_size=500)
+    message_text=_MESSAGE_TEXT
 )
 def test_immediate_user_message_display_property(message_text):
     """
@@ -126,10 +172,9 @@ def test_distinct_message_styling():
     assert user_message.css_classes != ai_message.css_classes
 
 
-@settings(max_examples=100)
 @given(
-    user_text=st.text(min_size=1, max_size=500),
-    ai_text=st.text(min_size=1, max_size=500)
+    user_text=_MESSAGE_TEXT,
+    ai_text=_MESSAGE_TEXT
 )
 def test_distinct_message_styling_property(user_text, ai_text):
     """
@@ -178,7 +223,7 @@ def test_ai_message_has_icon():
     ai_message = simulate_add_message("AI response", 'ai')
     
     assert ai_message.has_icon is True
-    assert ai_message.icon in ['🔮', '⚖️']
+    assert ai_message.icon in _THEME_ICONS
 
 
 def test_user_message_no_icon():
@@ -190,61 +235,6 @@ def test_user_message_no_icon():
     assert user_message.has_icon is False
 
 
-@settings(max_examples=100)
-@given(
-    ai_text=st.text(min_size=1, max_size=500)
-)
-def test_ai_message_visual_indicators_property(ai_text):
-    """
-    Feature: ui-design-improvements, Property 18: AI message visual indicators
-    
-    Property: For any AI message displayed, the message element should contain 
-    an icon or avatar element to identify it as an AI response.
-    
-    This property-based test generates random AI messages to ensure
-    all AI responses include visual indicators.
-    
-    Validates: Requirements 9.2
-    """
-    # Create AI message
-    ai_message = simulate_add_message(ai_text, 'ai')
-    
-    # AI message should have an icon
-    assert ai_message.has_icon is True, (
-        "AI message should have an icon/avatar"
-    )
-    
-    # Icon should be one of the theme-appropriate icons
-    assert ai_message.icon in ['🔮', '⚖️'], (
-        f"AI message icon should be theme-appropriate, got: {ai_message.icon}"
-    )
-
-
-@settings(max_examples=100)
-@given(
-    user_text=st.text(min_size=1, max_size=500)
-)
-def test_user_message_no_visual_indicators_property(user_text):
-    """
-    Feature: ui-design-improvements, Property 18: AI message visual indicators
-    
-    Property: User messages should NOT have icons/avatars, maintaining
-    visual distinction from AI messages.
-    
-    This property-based test ensures user messages remain visually distinct
-    by not including AI-specific visual indicators.
-    
-    Validates: Requirements 9.2
-    """
-    # Create user message
-    user_message = simulate_add_message(user_text, 'user')
-    
-    # User message should NOT have an icon
-    assert user_message.has_icon is False, (
-        "User message should not have an icon/avatar"
-    )
-
-
 # ========================================
 # Property 19: Timestamp display when relevant
 # ========================================
@@ -260,116 +250,56 @@ def test_message_has_timestamp():
     assert ai_message.has_timestamp_element is True
 
 
-@settings(max_examples=100)
-@given(
-    message_text=st.text(min_size=1, max_size=500),
-    message_type=st.sampled_from(['user', 'ai'])
-)
-def test_timestamp_display_property(message_text, message_type):
+@given(generated=messages())
+def test_message_invariants_property(generated):
     """
+    Feature: ui-design-improvements, Property 18: AI message visual indicators
     Feature: ui-design-improvements, Property 19: Timestamp display when relevant
     
-    Property: For any message where timing information is relevant, the message 
-    element should include a timestamp element.
+    Property: For any message added to the chat, the message element should:
+    - preserve its text exactly as provided (no truncation or modification)
+    - keep the message type it was created with
+    - carry a theme-appropriate icon if it is an AI message, and no icon
+      if it is a user message
+    - include a timestamp element holding a datetime that formats as HH:MM
     
-    This property-based test generates random messages to ensure
-    all messages include timestamp information.
+    All invariants are checked against the same generated message in one pass.
     
-    Validates: Requirements 9.5
+    Validates: Requirements 9.2, 9.4, 9.5
     """
-    # Create message
-    message = simulate_add_message(message_text, message_type)
+    text, message_type, message = generated
     
-    # Message should have a timestamp element
-    assert message.has_timestamp_element is True, (
-        f"{message_type.capitalize()} message should have a timestamp element"
+    # Message text and type should be preserved exactly
+    assert message.text == text, (
+        "Message text should be preserved without modification"
     )
-    
-    # Message should have a timestamp value
-    assert message.timestamp is not None, (
-        "Message should have a timestamp value"
+    assert message.type == message_type, (
+        f"Message type should be '{message_type}'"
     )
     
-    # Timestamp should be a datetime object
+    # Only AI messages carry an icon, and it must suit the theme
+    if message_type == 'ai':
+        assert message.has_icon is True, "AI message should have an icon/avatar"
+        assert message.icon in _THEME_ICONS, (
+            f"AI message icon should be theme-appropriate, got: {message.icon}"
+        )
+    else:
+        assert message.has_icon is False, (
+            "User message should not have an icon/avatar"
+        )
+    
+    # Message should have a timestamp element and a datetime value
+    assert message.has_timestamp_element is True, (
+        f"{message_type.capitalize()} message should have a timestamp element"
+    )
     assert isinstance(message.timestamp, datetime), (
         "Timestamp should be a datetime object"
     )
-
-
-@settings(max_examples=100)
-@given(
-    message_text=st.text(min_size=1, max_size=500),
-    message_type=st.sampled_from(['user', 'ai'])
-)
-def test_timestamp_format_property(message_text, message_type):
-    """
-    Feature: ui-design-improvements, Property 19: Timestamp display when relevant
-    
-    Property: For any message, the timestamp should be in a valid time format
-    that can be displayed to users.
-    
-    This property-based test ensures timestamps are properly formatted
-    and can be rendered in the UI.
-    
-    Validates: Requirements 9.5
-    """
-    # Create message
-    message = simulate_add_message(message_text, message_type)
-    
-    # Timestamp should be valid
-    assert message.timestamp is not None
     
     # Should be able to format timestamp as string
     time_string = message.timestamp.strftime('%H:%M')
-    assert len(time_string) > 0, "Timestamp should be formattable as string"
     assert ':' in time_string, "Timestamp should contain time separator"
 
 
-# ========================================
-# Additional property tests
-# ========================================
-
-@settings(max_examples=100)
-@given(
-    message_text=st.text(min_size=1, max_size=1000),
-    message_type=st.sampled_from(['user', 'ai'])
-)
-def test_message_text_preservation_property(message_text, message_type):
-    """
-    Property: For any message text, the content should be preserved exactly
-    as provided (no truncation or modification).
-    
-    This ensures long messages are properly handled with text wrapping
-    rather than being cut off.
-    
-    Validates: Requirements 9.4
-    """
-    message = simulate_add_message(message_text, message_type)
-    
-    # Message text should be preserved exactly
-    assert message.text == message_text, (
-        "Message text should be preserved without modification"
-    )
-
-
-@settings(max_examples=100)
-@given(
-    message_type=st.sampled_from(['user', 'ai'])
-)
-def test_message_type_consistency_property(message_type):
-    """
-    Property: For any message type, the message should consistently
-    maintain its type throughout its lifecycle.
-    
-    This ensures message types don't change unexpectedly.
-    """
-    message = simulate_add_message("Test message", message_type)
-    
-    # Message type should match input
-    assert message.type == message_type, (
-        f"Message type should be '{message_type}'"
-    )
-
-
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
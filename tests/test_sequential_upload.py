@@ -5,7 +5,7 @@ Feature: ui-design-improvements, Property 6: Sequential upload processing
 Validates: Requirements 5.5
 """
 
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 import pytest
 
 
@@ -146,7 +146,6 @@ def test_queue_status_tracking():
     assert len(queue.completed_uploads) == 2
 
 
-@settings(max_examples=100)
 @given(
     num_files=st.integers(min_value=1, max_value=20)
 )
@@ -187,7 +186,6 @@ def test_sequential_processing_order(num_files):
     )
 
 
-@settings(max_examples=100)
 @given(
     num_files=st.integers(min_value=2, max_value=20)
 )
@@ -229,7 +227,6 @@ def test_no_concurrent_processing(num_files):
         )
 
 
-@settings(max_examples=100)
 @given(
     file_names=st.lists(
         st.text(min_size=1, max_size=50).filter(lambda x: '/' not in x and '\\' not in x),
@@ -270,7 +267,6 @@ def test_queue_preserves_file_identity(file_names):
     )
 
 
-@settings(max_examples=100)
 @given(
     num_files=st.integers(min_value=1, max_value=20)
 )
@@ -307,7 +303,6 @@ def test_queue_status_updates_correctly(num_files):
     )
 
 
-@settings(max_examples=100)
 @given(
     batch1_size=st.integers(min_value=1, max_value=10),
     batch2_size=st.integers(min_value=1, max_value=10)
@@ -352,7 +347,6 @@ def test_queue_handles_multiple_batches(batch1_size, batch2_size):
     )
 
 
-@settings(max_examples=100)
 @given(
     num_files=st.integers(min_value=1, max_value=20)
 )
@@ -387,7 +381,6 @@ def test_completed_uploads_removed_from_queue(num_files):
     )
 
 
-@settings(max_examples=100)
 @given(
     num_files=st.integers(min_value=2, max_value=15)
 )
@@ -422,7 +415,6 @@ def test_queue_processes_until_empty(num_files):
     )
 
 
-@settings(max_examples=100)
 @given(
     num_files=st.integers(min_value=1, max_value=20),
     file_sizes=st.lists(
@@ -5,7 +5,7 @@ Feature: ui-design-improvements, Property 5: Upload error feedback
 Validates: Requirements 5.3
 """
 
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 import pytest
 
 
@@ -86,7 +86,6 @@ def test_error_message_without_auto_dismiss():
     # Errors should not auto-dismiss (unlike success messages)
 
 
-@settings(max_examples=100)
 @given(
     error_reason=st.text(min_size=1, max_size=200)
 )
@@ -122,7 +121,6 @@ def test_error_feedback_always_contains_error_reason(error_reason):
     )
 
 
-@settings(max_examples=100)
 @given(
     error_reason=st.text(min_size=1, max_size=200)
 )
@@ -152,7 +150,6 @@ def test_error_feedback_always_has_dismiss_button(error_reason):
     )
 
 
-@settings(max_examples=100)
 @given(
     error_reason=st.text(min_size=1, max_size=200)
 )
@@ -181,7 +178,6 @@ def test_error_feedback_can_be_manually_dismissed(error_reason):
     )
 
 
-@settings(max_examples=100)
 @given(
     error1=st.text(min_size=1, max_size=100),
     error2=st.text(min_size=1, max_size=100)
@@ -215,7 +211,6 @@ def test_error_feedback_replaces_previous_error(error1, error2):
     assert state.is_dismissible is True
 
 
-@settings(max_examples=100)
 @given(
     error_reason=st.text(min_size=1, max_size=200)
 )
@@ -244,7 +239,6 @@ def test_error_feedback_is_deterministic(error_reason):
     assert state1.is_dismissible == state2.is_dismissible
 
 
-@settings(max_examples=100)
 @given(
     error_reason=st.sampled_from([
         'File type not supported',
@@ -281,7 +275,6 @@ def test_error_feedback_handles_common_error_types(error_reason):
     assert state.is_dismissible is True
 
 
-@settings(max_examples=100)
 @given(
     error_reason=st.text(min_size=1, max_size=200)
 )
@@ -314,7 +307,6 @@ def test_error_feedback_persists_until_dismissed(error_reason):
     assert state.is_visible is False
 
 
-@settings(max_examples=100)
 @given(
     error_reason=st.text(min_size=1, max_size=200).filter(lambda x: '<' not in x and '>' not in x)
 )
@@ -341,7 +333,6 @@ def test_error_feedback_handles_special_characters(error_reason):
     assert state.is_dismissible is True
 
 
-@settings(max_examples=100)
 @given(
     error_reason=st.text(min_size=1, max_size=200)
 )
@@ -372,7 +363,6 @@ def test_error_feedback_state_after_dismiss(error_reason):
     assert state.error_reason == original_error
 
 
-@settings(max_examples=100)
 @given(
     num_errors=st.integers(min_value=1, max_value=10),
     error_reasons=st.lists(
@@ -5,7 +5,7 @@ Feature: ui-design-improvements, Property 3: Upload progress feedback
 Validates: Requirements 5.1
 """
 
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 import pytest
 
 
@@ -116,7 +116,6 @@ def test_stage_defaults_when_missing():
     assert state.stage == 'processing'
 
 
-@settings(max_examples=100)
 @given(
     progress_values=st.lists(
         st.integers(min_value=0, max_value=100),
@@ -150,7 +149,6 @@ def test_progress_always_within_valid_range(progress_values):
         assert state.is_visible is True
 
 
-@settings(max_examples=100)
 @given(
     progress_values=st.lists(
         st.integers(min_value=-1000, max_value=1000),
@@ -183,7 +181,6 @@ def test_progress_clamping_for_invalid_values(progress_values):
         )
 
 
-@settings(max_examples=100)
 @given(
     file_size_mb=st.integers(min_value=1, max_value=10)
 )
@@ -216,7 +213,6 @@ def test_upload_progress_is_monotonic(file_size_mb):
     assert history[-1] == 100, "Progress should end at 100%"
 
 
-@settings(max_examples=100)
 @given(
     num_updates=st.integers(min_value=1, max_value=50)
 )
@@ -247,7 +243,6 @@ def test_progress_update_count_matches_calls(num_updates):
     assert len(state.percent_history) == num_updates
 
 
-@settings(max_examples=100)
 @given(
     stages=st.lists(
         st.sampled_from(['reading', 'parsing', 'vectorizing', 'finalizing', 'complete']),
@@ -279,7 +274,6 @@ def test_stage_updates_are_preserved(stages):
         )
 
 
-@settings(max_examples=100)
 @given(
     percent=st.integers(min_value=0, max_value=100),
     stage=st.sampled_from(['reading', 'parsing', 'vectorizing', 'finalizing', 'complete', None])
@@ -316,7 +310,6 @@ def test_progress_update_is_idempotent(percent, stage):
     assert state1.is_visible == state2.is_visible
 
 
-@settings(max_examples=100)
 @given(
     file_size_mb=st.integers(min_value=1, max_value=10)
 )
@@ -358,7 +351,6 @@ def test_complete_upload_cycle(file_size_mb):
     )
 
 
-@settings(max_examples=100)
 @given(
     percent1=st.integers(min_value=0, max_value=100),
     percent2=st.integers(min_value=0, max_value=100)
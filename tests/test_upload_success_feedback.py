@@ -5,7 +5,7 @@ Feature: ui-design-improvements, Property 4: Upload success feedback
 Validates: Requirements 5.2
 """
 
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 import pytest
 
 
@@ -99,7 +99,6 @@ def test_plural_pages_text():
     assert '5 pages' in state.message
 
 
-@settings(max_examples=100)
 @given(
     filename=st.text(min_size=1, max_size=100).filter(lambda x: '/' not in x and '\\' not in x),
     page_count=st.integers(min_value=1, max_value=1000)
@@ -141,7 +140,6 @@ def test_success_feedback_always_contains_filename_and_page_count(filename, page
     )
 
 
-@settings(max_examples=100)
 @given(
     filename=st.text(min_size=1, max_size=100).filter(lambda x: '/' not in x and '\\' not in x),
     page_count=st.integers(min_value=1, max_value=1000)
@@ -175,7 +173,6 @@ def test_success_feedback_auto_dismiss_always_scheduled(filename, page_count):
     )
 
 
-@settings(max_examples=100)
 @given(
     filename=st.text(min_size=1, max_size=100).filter(lambda x: '/' not in x and '\\' not in x),
     page_count=st.integers(min_value=1, max_value=1000)
@@ -213,7 +210,6 @@ def test_success_feedback_correct_pluralization(filename, page_count):
         )
 
 
-@settings(max_examples=100)
 @given(
     filename1=st.text(min_size=1, max_size=50).filter(lambda x: '/' not in x and '\\' not in x),
     page_count1=st.integers(min_value=1, max_value=100),
@@ -253,7 +249,6 @@ def test_success_feedback_replaces_previous_message(filename1, page_count1, file
     assert str(page_count2) in state.message
 
 
-@settings(max_examples=100)
 @given(
     filename=st.text(min_size=1, max_size=100).filter(lambda x: '/' not in x and '\\' not in x),
     page_count=st.integers(min_value=1, max_value=1000)
@@ -283,7 +278,6 @@ def test_success_feedback_can_be_dismissed(filename, page_count):
     )
 
 
-@settings(max_examples=100)
 @given(
     filename=st.text(min_size=1, max_size=100).filter(lambda x: '/' not in x and '\\' not in x and '"' not in x),
     page_count=st.integers(min_value=1, max_value=1000)
@@ -312,7 +306,6 @@ def test_success_feedback_handles_special_characters_in_filename(filename, page_
     assert filename in state.message
 
 
-@settings(max_examples=100)
 @given(
     filename=st.text(min_size=1, max_size=100).filter(lambda x: '/' not in x and '\\' not in x),
     page_count=st.integers(min_value=1, max_value=1000)